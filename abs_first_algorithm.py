@@ -12,39 +12,41 @@ Usage:
   >>> main()
   Polynomial approximation of ABS function
   Order: 10
-  Coefficients: [2.784511444309240e-02, 7.387882828314054e-15,
-  4.753650534277715e+00, -2.198759996752948e-13, -2.064625072315169e+01,
-  9.222549488347914e-13, 4.777533702515291e+01, -1.369184236745336e-12,
-  -4.959209462628783e+01, 6.694441544223950e-13, 1.870935779000889e+01]
-  Error: 2.784511444310045e-02
+  Coefficients: [2.784511444309406e-02, 7.108563913713596e-16,
+  4.753650534277765e+00, -7.363276902127709e-17, -2.064625072315222e+01,
+  -8.283570705091891e-14, 4.777533702515474e+01, 2.225209048574070e-13,
+  -4.959209462629030e+01, -1.422381847651572e-13, 1.870935779001001e+01]
+  Error: 2.784511444310178e-02
   Iterations: 32
-  Duration: 0.0073 sec
+  Duration: 0.0068 sec
   Finished.
 """
 
-from time import process_time
+from time import perf_counter_ns
+import numpy as np
 from remes_first_algorithm import remez_poly
-from utility import plot_result
+from utility import plot_result, format_coeffs
 
 def main() -> None:
   """Polynomial approximation of ABS function"""
   print('Polynomial approximation of ABS function')
-  f = abs       # define the function to be approximated
+  f = np.fabs   # define the function to be approximated
   lower = -1.0  # lower limit on interval of approximation
   upper = 1.0   # upper limit on interval of approximation
   num = 9999    # number of grid points in the interval
   mit = 50      # maximum number of iterations
   order = 10    # Polynomial order
   # calculate the best approximation on grid
-  start_time = process_time()
+  start_time = perf_counter_ns()
   coefficients, error, it = remez_poly(f, lower, upper, num, order, mit)
-  end_time = process_time()
+  end_time = perf_counter_ns()
+  duration = 1.0e-9 * (end_time - start_time)
   # display the results
   print(f'Order: {order}')
-  print(f"Coefficients: [{', '.join([f'{c:.15e}' for c in coefficients])}]") # type: ignore
+  print(f'Coefficients: {format_coeffs(coefficients)}')
   print(f'Error: {error:.15e}')
   print(f'Iterations: {it}')
-  print(f'Duration: {end_time-start_time:.4f} sec')
+  print(f'Duration: {duration:.4f} sec')
   # plot results using matplotlib
   plot_result(f, coefficients, lower, upper, num,
     'Polynomial Approximation of ABS function')
@@ -14,20 +14,20 @@ Usage:
   >>> main()
   Polynomial approximation of ABS function via sqrt
   Order: 10
-  Coefficients: [2.784511295627812e-02, 0.000000000000000e+00,
-  4.753651366305149e+00, 0.000000000000000e+00, -2.064625642431383e+01,
-  0.000000000000000e+00, 4.777535052265449e+01, 0.000000000000000e+00,
-  -4.959210799337704e+01, 0.000000000000000e+00, 1.870936252873123e+01]
-  Error: 2.784511295627934e-02
+  Coefficients: [2.784511295627815e-02, 0.000000000000000e+00,
+  4.753651366305149e+00, 0.000000000000000e+00, -2.064625642431379e+01,
+  0.000000000000000e+00, 4.777535052265438e+01, 0.000000000000000e+00,
+  -4.959210799337691e+01, 0.000000000000000e+00, 1.870936252873118e+01]
+  Error: 2.784511295628100e-02
   Iterations: 6
-  Duration: 0.0018 sec
+  Duration: 0.0038 sec
   Finished.
 """
 
-from math import sqrt
-from time import thread_time_ns
+from time import perf_counter_ns
+import numpy as np
 from remes_second_algorithm import remez_poly
-from utility import plot_result
+from utility import plot_result, format_coeffs
 
 def main() -> None:
   """Polynomial approximation of ABS function via sqrt."""
@@ -38,25 +38,25 @@ def main() -> None:
   mit = 50      # maximum number of iterations
   order = 5     # Polynomial order
   # start the timekeeping
-  start_time = thread_time_ns()
+  start_time = perf_counter_ns()
   # calculate the best approximation on grid for sqrt
-  sqrt_coeffs, error, it = remez_poly(sqrt, lower, upper, num, order, mit)
-  # transform coefficients by substitution (x -> x*x)
-  abs_coeffs = [0.0]*(2*order+1)
-  for (i, coeff) in enumerate(sqrt_coeffs): # type: ignore
-    abs_coeffs[2*i] = coeff
+  sqrt_coeffs, error, it = remez_poly(np.sqrt, lower, upper, num, order, mit)
+  # transform coefficients by substitution (x -> x*x), the odd order
+  # coefficients are all zero and are only expanded for display
+  abs_coeffs = np.zeros(2*order+1)
+  abs_coeffs[::2] = sqrt_coeffs
   # stop the timekeeping
-  end_time = thread_time_ns()
+  end_time = perf_counter_ns()
   duration = 1.0e-9 * (end_time - start_time)
   # display the results
   print(f'Order: {2*order}')
-  print(f"Coefficients: [{', '.join([f'{c:.15e}' for c in abs_coeffs])}]")
+  print(f'Coefficients: {format_coeffs(abs_coeffs)}')
   print(f'Error: {error:.15e}')
   print(f'Iterations: {it}')
   print(f'Duration: {duration:.4f} sec')
   # plot results using matplotlib
-  plot_result(abs, abs_coeffs, -upper, upper, 2*num-1, # type: ignore
-    'Polynomial Approximation of ABS function')
+  plot_result(np.fabs, sqrt_coeffs, -upper, upper, 2*num-1,
+    'Polynomial Approximation of ABS function', even=True)
   print('Finished.')
 
 if __name__ == '__main__':
@@ -12,47 +12,50 @@ Usage:
   >>> main()
   Polynomial approximation of A-LAW conversion
   Order: 10
-  Coefficients: [1.509903313490213e-14, 5.711621347942959e+00,
-  6.223866060379512e-15, -3.814367754230961e+01, -2.353282805501313e-13,
-  1.149002804108091e+02, 2.732173246291716e-13, -1.409781429279190e+02,
-  3.941328610540449e-13, 5.969949732470351e+01, -4.328626735529707e-13]
+  Coefficients: [-1.154631945610163e-14, 5.711621347943009e+00,
+  6.122967329476998e-14, -3.814367754231061e+01, -1.686783366734040e-12,
+  1.149002804108133e+02, 5.973649960521604e-12, -1.409781429279252e+02,
+  -7.414378964754420e-12, 5.969949732470648e+01, 3.064501880999709e-12]
   Error: 1.895786e-01
   Iterations: 6
-  Duration: 0.0050 sec
+  Duration: 0.0049 sec
   Finished.
 """
 
-from time import process_time
-from math import log
+from time import perf_counter_ns
+import numpy as np
 from remes_second_algorithm import remez_poly
-from utility import plot_result
+from utility import plot_result, format_coeffs
 
 def main() -> None:
   """Polynomial approximation of A-LAW conversion."""
   print('Polynomial approximation of A-LAW conversion')
-  def alaw(x: float) -> float:
+  def alaw(x: np.ndarray) -> np.ndarray:
     """A-LAW Conversion function"""
-    abs_x = abs(x)
-    if abs_x < 0.011415525114155252:
-      y = 16.006487384190198 * abs_x
-    else:
-      y = 0.1827224587236324 * (1.0 + log(87.6*abs_x))
-    return y if x >= 0.0 else -y
+    abs_x = np.fabs(x)
+    # both segments are evaluated over the whole array, then selected
+    small = 16.006487384190198*abs_x
+    # logarithm guarded against zero, where the small segment is selected
+    guarded_x = np.maximum(abs_x, np.finfo(abs_x.dtype).tiny)
+    large = 0.1827224587236324*(1.0 + np.log(87.6*guarded_x))
+    y = np.where(abs_x < 0.011415525114155252, small, large)
+    return np.copysign(y, x)
   lower = -1.0    # lower limit on interval of approximation
   upper = +1.0    # upper limit on interval of approximation
   num = 9999      # number of grid points in the interval
   mit = 10        # maximum number of iterations
   order = 10      # polynomial order
   # calculate the best approximation on grid
-  start_time = process_time()
+  start_time = perf_counter_ns()
   coefficients, error, it = remez_poly(alaw, lower, upper, num, order, mit)
-  end_time = process_time()
+  end_time = perf_counter_ns()
+  duration = 1.0e-9 * (end_time - start_time)
   # display the results
   print(f'Order: {order}')
-  print(f"Coefficients: [{', '.join([f'{c:.15e}' for c in coefficients])}]") # type: ignore
+  print(f'Coefficients: {format_coeffs(coefficients)}')
   print(f'Error: {error:.6e}')
   print(f'Iterations: {it}')
-  print(f'Duration: {end_time-start_time:.4f} sec')
+  print(f'Duration: {duration:.4f} sec')
   # plot results
   plot_result(alaw, coefficients, lower, upper, num,
     'Polynomial Approximation of A-LAW conversion')
@@ -12,48 +12,44 @@ Usage:
   >>> main()
   Polynomial approximation of Clipped-Sine function
   Order: 10
-  Coefficients: [3.108624468950438e-15, 1.134440169085747e+00,
-  -8.975370614993066e-15, -5.246896708630510e-01, 1.367504204994999e-14,
-  1.359916020436154e-01, -4.445779667613974e-15, -1.611494182503933e-02,
-  5.245307811873813e-16, 6.639910919147184e-04, -2.082229309880595e-17]
+  Coefficients: [-7.199589307944254e-15, 1.134440169085736e+00,
+  6.126495381715119e-15, -5.246896708630370e-01, -1.927677789442487e-15,
+  1.359916020436112e-01, 3.680037147294384e-16, -1.611494182503885e-02,
+  -4.150336723754214e-17, 6.639910919146991e-04, 1.855737319973970e-18]
   Error: 3.250974e-02
   Iterations: 17
-  Duration: 0.0058 sec
-  Finished.  
+  Duration: 0.0063 sec
+  Finished.
 """
 
-from time import process_time
-from math import sin, pi
+from time import perf_counter_ns
+import numpy as np
 from remes_first_algorithm import remez_poly
-from utility import plot_result
+from utility import plot_result, format_coeffs
 
 def main() -> None:
   """Polynomial approximation of Clipped-Sine function"""
   print('Polynomial approximation of Clipped-Sine function')
-  def clipped_sine(x : float) -> float:
+  def clipped_sine(x: np.ndarray) -> np.ndarray:
     """The clipped sine function."""
-    y = sin(x)
-    if y > 0.7071067811865475:
-      y = 0.7071067811865475
-    elif y < -0.7071067811865475:
-      y = -0.7071067811865475
-    return y
-  lower = -pi   # lower limit on interval of approximation
-  upper = pi    # upper limit on interval of approximation
+    return np.clip(np.sin(x), -0.7071067811865475, 0.7071067811865475)
+  lower = -np.pi  # lower limit on interval of approximation
+  upper = np.pi   # upper limit on interval of approximation
   num = 9999    # number of grid points in the interval
   mit = 100     # maximum number of iterations
   order = 10    # polynomial order
   # calculate the best approximation on grid
-  start_time = process_time()
+  start_time = perf_counter_ns()
   coefficients, error, it = remez_poly(clipped_sine, lower, upper, num,
     order, mit)
-  end_time = process_time()
+  end_time = perf_counter_ns()
+  duration = 1.0e-9 * (end_time - start_time)
   # display the results
   print(f'Order: {order}')
-  print(f"Coefficients: [{', '.join([f'{c:.15e}' for c in coefficients])}]") # type: ignore
+  print(f'Coefficients: {format_coeffs(coefficients)}')
   print(f'Error: {error:.6e}')
   print(f'Iterations: {it}')
-  print(f'Duration: {end_time-start_time:.4f} sec')
+  print(f'Duration: {duration:.4f} sec')
   # plot results
   plot_result(clipped_sine, coefficients, lower, upper, num,
     'Polynomial Approximation of Clipped-Sine function')
@@ -2,7 +2,8 @@
 
 The test uses Remez's second algorithm to find a 5th order polynomial
 approximation to the sensor conversion over the interval [21, 181]. A
-linear grid of 161 points is used.
+linear grid of 161 points is used. The conversion table is mapped onto the
+grid once and the same values are used for the plot.
 
 Module:
   conversion_second_algorithm
@@ -12,25 +13,27 @@ Usage:
   >>> main()
   Polynomial approximation of SENSOR conversion
   Order: 5
-  Coefficients: [1.319699436191457e+02, -3.356182779338306e+00,
-  4.725400457537449e-02, -3.903774757931707e-04, 1.650017652970575e-06,
-  -2.880578609292462e-09]
+  Coefficients: [1.319699436191461e+02, -3.356182779338335e+00,
+  4.725400457537525e-02, -3.903774757931797e-04, 1.650017652970623e-06,
+  -2.880578609292559e-09]
   Error: 9.770320e-01
   Iterations: 4
-  Duration: 0.0009 sec
+  Duration: 0.0033 sec
   Finished.
 """
 
-from time import process_time
-from convert import calibrated
-from remes_second_algorithm import remez_poly
-from utility import plot_result
+from time import perf_counter_ns
+import numpy as np
+from convert import calibrated_vec
+from remez_core import linear_grid, map_onto_grid
+from remes_second_algorithm import remez_grid
+from utility import plot_result, format_coeffs
 
 def main() -> None:
   """Polynomial approximation of SENSOR conversion."""
-  def f(x: float) -> int:
-    """Convert raw value to temperature."""
-    return calibrated(round(x))
+  def f(x: np.ndarray) -> np.ndarray:
+    """Convert raw values to temperature."""
+    return calibrated_vec(np.rint(x).astype(int))
   print('Polynomial approximation of SENSOR conversion')
   lower = 21    # lower limit on interval of approximation
   upper = 181   # define the function to be approximated
@@ -38,18 +41,21 @@ def main() -> None:
   mit = 5       # maximum number of iterations
   order = 5     # polynomial order
   # calculate the best approximation on grid
-  start_time = process_time()
-  coefficients, error, it = remez_poly(f, lower, upper, num, order, mit)
-  end_time = process_time()
+  start_time = perf_counter_ns()
+  grid = linear_grid(lower, upper, num)
+  f_grid = map_onto_grid(f, grid)
+  coefficients, error, it = remez_grid(grid, f_grid, order, mit)
+  end_time = perf_counter_ns()
+  duration = 1.0e-9 * (end_time - start_time)
   # display the results
   print(f'Order: {order}')
-  print(f"Coefficients: [{', '.join([f'{c:.15e}' for c in coefficients])}]")
+  print(f'Coefficients: {format_coeffs(coefficients)}')
   print(f'Error: {error:.6e}')
   print(f'Iterations: {it}')
-  print(f'Duration: {end_time-start_time:.4f} sec')
-  # plot results
+  print(f'Duration: {duration:.4f} sec')
+  # plot results, reusing the function values mapped onto the grid
   plot_result(f, coefficients, lower, upper, num,
-    'Polynomial Approximation of SENSOR conversion')
+    'Polynomial Approximation of SENSOR conversion', mapped=(grid, f_grid))
   print('Finished.')
 
 if __name__ == '__main__':
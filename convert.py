@@ -8,7 +8,13 @@ Typical usage:
     >>> reading = 21
     >>> actual = convert.calibrated(reading)
     >>> print(f'Actual = {actual}')
+
+    >>> import numpy as np
+    >>> from convert import calibrated_vec
+    >>> readings = np.arange(21, 182)
+    >>> actual = calibrated_vec(readings)
 """
+import numpy as np
 
 # Lookup table to convert sensor reading to calibrated value
 CONVERSION_TABLE: list[int] = [
@@ -31,6 +37,9 @@ CONVERSION_TABLE: list[int] = [
   -30
 ]
 
+# Lookup table as an array, for converting many readings with a single gather
+_TABLE = np.array(CONVERSION_TABLE, dtype=np.int8)
+
 def calibrated(raw: int) -> int:
   """Convert raw sensor reading to a calibrated value
 
@@ -48,3 +57,20 @@ def calibrated(raw: int) -> int:
   if raw < 21 or raw > 181: raise ValueError('Invalid raw argument')
   return CONVERSION_TABLE[raw - 21]
 
+def calibrated_vec(raw: np.ndarray) -> np.ndarray:
+  """Convert an array of raw sensor readings to calibrated values
+
+  Args:
+    raw: An array of the raw values read from the sensor. These must have
+    integer values in the range of 21 to 181, inclusive.
+
+  Returns:
+    An array of the calibrated values, represented as integers.
+
+  Raises:
+    ValueError: An element of the raw argument does not lie in the range of 21
+    to 181, inclusive.
+  """
+  raw = np.asarray(raw)
+  if np.any(raw < 21) or np.any(raw > 181): raise ValueError('Invalid raw argument')
+  return _TABLE[raw - 21]
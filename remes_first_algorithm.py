@@ -1,14 +1,15 @@
 """Discrete Remez Algorithm for Polynomials
 
 Find the optimal polynomial for approximating a function on a discrete linear
-grid using Remez's first algorithm.
+grid using Remez's first algorithm. The iteration is shared with the second
+algorithm and implemented in remez_core.py.
 
 Module:
   remes_first_algorithm.py
 
 Typical usage:
 
-  from math import tan, pi
+  from numpy import tan, pi
   from remes_first_algorithm import remez_poly
 
   f = tan           # define the function
@@ -22,6 +23,7 @@ Typical usage:
   coefficients, error, it = remez_poly(f, lower, upper, num, order, mit)
 """
 import numpy as np
+import remez_core
 
 def remez_poly(
   func,
@@ -29,7 +31,8 @@ def remez_poly(
   stop: float,
   num: int,
   ndeg: int,
-  max_iter: int
+  max_iter: int,
+  dtype: type = np.float64
 ) -> tuple[np.ndarray, float, int]:
   """ Discrete Remez Algorithm for polynomials
 
@@ -37,103 +40,33 @@ def remez_poly(
   optimal polynomial approximation to a function f on a discrete linear grid.
 
   Args:
-    func: A function (or lambda) f: x -> Result.
+    func: A function (or lambda) f: x -> Result. If it accepts an array it is
+      applied to the whole grid in a single call.
     start: The starting value of the grid.
     stop: The end value of the grid.
     num: The number of points on the grid.
     ndeg: The degree of the approximation polynomial.
     max_iter: The maximum number of iterations.
+    dtype: The floating point type used to store the grid and the function
+      values, see remez_core.remez_poly.
 
   Returns:
     A tuple containing an array of the polynomial coefficients, a float
     which is the maximum error of approximation and an integer which is the
     number of iterations required. The ordering of the coefficients in the
     array is: [a0, a1, ..., an], for an nth order polynomial.
-  """
-
-  # nested functions
-
-  def chebpts(npts: int, ngrid: int) -> np.ndarray:
-    """Generate an array containing the starting test points.
-
-    These points are distributed across the grid starting at zero, with the last
-    point at ngrid-1 and are the Chebyshev points of the second kind. The
-    values are rounded to the nearest integer.
-
-    Args:
-      npts:   The number of test points.
-      ngrid:  The number of grid points
-
-    Returns:
-      An array containing the starting test points in ascending order.
-    """
-    pts = np.round(0.5*(ngrid-1)*(1.0+np.polynomial.chebyshev.chebpts2(npts))) # type: ignore
-    return pts.astype(int)
-
-  def is_same_sign(first: float, second: float) -> bool:
-    """ Check two floating point numbers for matching signs.
 
-    A floating point number is considered positive if it is equal to or greater
-    than zero.
-
-    Args:
-      first: The first floating point number.
-      second: The second floating point number.
-
-    Returns:
-      A boolean value which is True if the two floating pointer numbers have
-      the same sign, otherwise False is returned.
-    """
-    return (first<0.0 and second<0.0) or (first >= 0.0 and second >=0.0)
-
-  # error scaling used to check for algorithm termination
-  scale = 1.0 + 4.55*np.spacing(1.0) # type: ignore
-  # initial level error
-  saved_level_error = 0.0
-  # create grid of points
-  grid = np.linspace(start, stop, num)
-  # function mapped onto grid
-  f_grid = np.vectorize(func)(grid)
-  # alternate signs array
-  sigma = np.power(-1.0, range(ndeg+2)) # type: ignore
-  # initial array of trial points
-  trial = chebpts(ndeg+2, num)
+  Raises:
+    ValueError: The dtype argument is not a floating point type.
+  """
+  return remez_core.remez_poly(func, start, stop, num, ndeg, max_iter,
+    exchange='single', dtype=dtype)
 
-  for it in range(max_iter):
-    # solve trial polynomial for given trial points
-    v = np.vander(grid[trial], trial.size-1, True) # type: ignore
-    a = np.insert(v, trial.size-1, sigma, 1) # type: ignore
-    x = np.linalg.solve(a, f_grid[trial]) # type: ignore
-    # retrieve polynomial coefficients
-    p = x[:-1]
-    # retrieve residual error at trial points
-    level_error = abs(x[-1])
-    # calculate the residual error over the grid
-    r_grid = f_grid - np.polynomial.polynomial.polyval(grid, p)
-    # check this if iteration is close to the optimal polynomial
-    if level_error < scale*saved_level_error:
-      max_residual = np.amax(np.fabs(r_grid)) # type: ignore
-      return (p, max_residual, it+1)
-    # save residual error for next iteration
-    saved_level_error = level_error
-    # identify the grid point at the greatest residual magnitude
-    point = np.argmax(np.fabs(r_grid)) # type: ignore
-    # update the array of trial points to include the extreme point
-    if point < trial[0]:
-      if not is_same_sign(r_grid[trial[0]], r_grid[point]):
-        trial = np.roll(trial, 1)
-      trial[0] = point # type: ignore
-    elif point > trial[-1]:
-      if not is_same_sign(r_grid[point], r_grid[trial[-1]]):
-        trial = np.roll(trial, -1)
-      trial[-1] = point # type: ignore
-    else:
-      for i in range(trial.size-1): # type: ignore
-        # test if point is in the interval [u[i], u[i+1]]
-        if trial[i]<=point<=trial[i+1]:
-          if is_same_sign(r_grid[trial[i]], r_grid[point]):
-            trial[i] = point # type: ignore
-          else:
-            trial[i+1] = point # type: ignore
-          break
-  raise RuntimeWarning('Failed to converge!')
+def remez_grid(
+  grid: np.ndarray,
+  f_grid: np.ndarray,
+  ndeg: int,
+  max_iter: int
+) -> tuple[np.ndarray, float, int]:
+  """Run remez_core.remez_grid with the single exchange."""
+  return remez_core.remez_grid(grid, f_grid, ndeg, max_iter, exchange='single')
@@ -0,0 +1,479 @@
+"""Discrete Remez Algorithm for Polynomials
+
+The implementation shared by the first and second algorithms of Remez. Both
+algorithms solve for a trial polynomial and calculate the residual error over
+the grid in the same way. They only differ in how the trial points are updated
+at the end of each iteration, which is selected with the exchange argument.
+The multiple exchange of the second algorithm is used by default.
+
+Module:
+  remez_core.py
+
+This module contains the following functions:
+
+  remez_poly: Find the optimal polynomial approximation to a function on a
+  linear grid constructed from the interval and number of points.
+
+  map_onto_grid: Map a function onto the grid, calling it once for the whole
+  grid when it accepts an array.
+
+  linear_grid: Construct a linear grid of points over an interval.
+
+  remez_grid: Find the optimal polynomial approximation on a given grid from
+  the function values already mapped onto it.
+
+  extreme_point: Identify the position of the greatest residual magnitude.
+
+  single_exchange: Update the trial points with a single extreme point. This
+  is the exchange step of the first algorithm.
+
+  multiple_exchange: Update all the trial points at once. This is the exchange
+  step of the second algorithm.
+
+Typical usage:
+
+  from numpy import tan, pi
+  from remez_core import remez_poly
+
+  f = tan           # define the function
+  lower = 0.0       # lower limit on interval
+  upper = 0.25*pi   # upper limit on interval
+  num = 51          # number of grid points in the interval
+  mit = 10          # maximum number of iterations
+  order = 5         # polynomial order
+
+  # calculate the coefficients of optimal polynomial and maximum error
+  coefficients, error, it = remez_poly(f, lower, upper, num, order, mit)
+"""
+from functools import lru_cache
+import numpy as np
+
+def map_onto_grid(func, grid: np.ndarray) -> np.ndarray:
+  """Map a function onto the grid.
+
+  A numpy ufunc, or any function accepting an array, is applied to the whole
+  grid in a single call. A function that only accepts a scalar, such as
+  math.tan, is called for each grid point and the results are collected
+  directly into an array.
+
+  Args:
+    func: A function (or lambda) f: x -> Result.
+    grid: An array containing the grid points.
+
+  Returns:
+    An array containing the function value at each grid point.
+
+  Examples:
+    A ufunc is applied to the whole grid, a function that only accepts a
+    scalar is called for each point, as is a function that returns a single
+    value for the whole grid rather than one value per point.
+
+    >>> import math
+    >>> grid = np.linspace(0.0, 1.0, 3)
+    >>> map_onto_grid(np.sqrt, grid)
+    array([0.        , 0.70710678, 1.        ])
+    >>> map_onto_grid(math.tan, grid)
+    array([0.        , 0.54630249, 1.55740772])
+    >>> map_onto_grid(np.linalg.norm, grid)
+    array([0. , 0.5, 1. ])
+  """
+  if isinstance(func, np.ufunc):
+    return func(grid)
+  try:
+    f_grid = func(grid)
+  except (TypeError, ValueError):
+    f_grid = None
+  if np.shape(f_grid) == grid.shape:
+    return np.asarray(f_grid, dtype=np.float64)
+  # scalar function, called for each grid point
+  return np.fromiter(map(func, grid), dtype=np.float64, count=grid.size)
+
+def linear_grid(
+  start: float,
+  stop: float,
+  num: int,
+  dtype: type = np.float64
+) -> np.ndarray:
+  """Construct a linear grid of points over an interval.
+
+  Args:
+    start: The starting value of the grid.
+    stop: The end value of the grid.
+    num: The number of points on the grid.
+    dtype: The floating point type of the grid.
+
+  Returns:
+    An array containing the grid points in ascending order.
+  """
+  if float(start).is_integer() and stop == start + (num - 1):
+    # consecutive integers, such as raw converter values, need no division
+    return np.arange(start, stop + 1.0, dtype=dtype)
+  return np.linspace(start, stop, num, dtype=dtype)
+
+def chebpts(npts: int, ngrid: int) -> np.ndarray:
+  """Generate an array containing the starting test points.
+
+  These points are distributed across the grid starting at zero, with the last
+  point at ngrid-1 and are the Chebyshev points of the second kind. The
+  values are rounded to the nearest integer.
+
+  Args:
+    npts:   The number of test points.
+    ngrid:  The number of grid points
+
+  Returns:
+    An array containing the starting test points in ascending order.
+  """
+  # the cached points are shared, so a copy is returned for the caller to update
+  return _chebpts(npts, ngrid).copy()
+
+@lru_cache(maxsize=128)
+def _chebpts(npts: int, ngrid: int) -> np.ndarray:
+  """Cached starting test points, see chebpts."""
+  pts = np.round(0.5*(ngrid-1)*(1.0+np.polynomial.chebyshev.chebpts2(npts))) # type: ignore
+  pts = pts.astype(int)
+  pts.flags.writeable = False
+  return pts
+
+def is_same_sign(first: float, second: float) -> bool:
+  """ Check two floating point numbers for matching signs.
+
+  A floating point number is considered positive if it is equal to or greater
+  than zero.
+
+  Args:
+    first: The first floating point number.
+    second: The second floating point number.
+
+  Returns:
+    A boolean value which is True if the two floating pointer numbers have
+    the same sign, otherwise False is returned.
+  """
+  return (first < 0.0) == (second < 0.0)
+
+def extreme_point(r: np.ndarray) -> int:
+  """Identify the position of the greatest residual magnitude.
+
+  This is equivalent to np.argmax(np.fabs(r)), including the choice of the
+  first position when there is a tie, but scans the residual error directly
+  rather than creating an array of magnitudes.
+
+  Args:
+    r: An array containing the residual error.
+
+  Returns:
+    The position of the residual error with the greatest magnitude.
+
+  Examples:
+    Equal positive and negative extremes, and repeated extremes, resolve to
+    the first position in the same way as np.argmax(np.fabs(r)).
+
+    >>> r = np.array([0.5, -1.0, 0.25, 1.0])
+    >>> extreme_point(r), int(np.argmax(np.fabs(r)))
+    (1, 1)
+    >>> r = np.array([1.0, 0.5, -1.0])
+    >>> extreme_point(r), int(np.argmax(np.fabs(r)))
+    (0, 0)
+    >>> r = np.array([0.2, 0.9, -0.3, 0.9])
+    >>> extreme_point(r), int(np.argmax(np.fabs(r)))
+    (1, 1)
+    >>> r = np.array([0.3, -0.9, 0.1, -0.9])
+    >>> extreme_point(r), int(np.argmax(np.fabs(r)))
+    (1, 1)
+  """
+  hi = int(np.argmax(r))
+  lo = int(np.argmin(r))
+  if r[hi] > -r[lo] or (r[hi] == -r[lo] and hi < lo):
+    return hi
+  return lo
+
+def single_exchange(
+  r_grid: np.ndarray,
+  trial: np.ndarray,
+  trial_update: np.ndarray
+) -> np.ndarray:
+  """Update the trial points with the point of greatest residual magnitude.
+
+  This is the exchange step of the first algorithm of Remez. The extreme point
+  replaces the neighbouring trial point whose residual error has the same
+  sign, so the alternation of signs over the trial points is maintained.
+
+  Args:
+    r_grid: An array containing the residual error at each grid position.
+    trial: An array containing the current trial points in ascending order.
+      It is updated in place.
+    trial_update: Unused. It is present so that both exchange steps share the
+      same signature, see multiple_exchange.
+
+  Returns:
+    The trial array, holding the updated trial points.
+
+  Examples:
+    The extreme point is inserted before the first trial point, or after the
+    last, shifting out the trial point at the opposite end when the signs
+    differ. An extreme point between two trial points replaces the one with
+    the same sign. An extreme point on a trial point leaves them unchanged.
+
+    >>> r = np.array([0.0, 0.0, 0.5, 0.0, -0.5, 0.0, 0.5, 0.0, -0.5, 0.0])
+    >>> def exchange(point, value):
+    ...   r_point = r.copy()
+    ...   r_point[point] = value
+    ...   return single_exchange(r_point, np.array([2, 4, 6, 8]), None)
+    >>> exchange(0, -0.9), exchange(0, 0.9)
+    (array([0, 2, 4, 6]), array([0, 4, 6, 8]))
+    >>> exchange(9, 0.9), exchange(9, -0.9)
+    (array([4, 6, 8, 9]), array([2, 4, 6, 9]))
+    >>> exchange(5, -0.9), exchange(5, 0.9)
+    (array([2, 5, 6, 8]), array([2, 4, 5, 8]))
+    >>> exchange(2, 0.9), exchange(6, 0.9), exchange(8, -0.9)
+    (array([2, 4, 6, 8]), array([2, 4, 6, 8]), array([2, 4, 6, 8]))
+  """
+  # identify the grid point at the greatest residual magnitude
+  point = extreme_point(r_grid)
+  # update the array of trial points to include the extreme point
+  if point < trial[0]:
+    if not is_same_sign(r_grid[trial[0]], r_grid[point]):
+      # shift right in place, dropping the last point
+      trial[1:] = trial[:-1]
+    trial[0] = point # type: ignore
+  elif point > trial[-1]:
+    if not is_same_sign(r_grid[point], r_grid[trial[-1]]):
+      # shift left in place, dropping the first point
+      trial[:-1] = trial[1:]
+    trial[-1] = point # type: ignore
+  else:
+    # binary search for the first interval [u[i], u[i+1]] containing the point
+    i = max(int(np.searchsorted(trial, point)) - 1, 0)
+    if is_same_sign(r_grid[trial[i]], r_grid[point]):
+      trial[i] = point # type: ignore
+    else:
+      trial[i+1] = point # type: ignore
+  return trial
+
+def multiple_exchange(
+  r_grid: np.ndarray,
+  trial: np.ndarray,
+  trial_update: np.ndarray
+) -> np.ndarray:
+  """Update all the trial points to the extreme points of the residual error.
+
+  This is the exchange step of the second algorithm of Remez. Each trial point
+  is moved to the extreme residual error of the same sign in its interval. An
+  additional extreme point outside the first or last trial point may then be
+  inserted, in which case the trial point at the opposite end is dropped.
+
+  Args:
+    r_grid: An array containing the residual error at each grid position.
+    trial: An array containing the current trial points in ascending order.
+    trial_update: An array of the same size as trial to receive the updated
+      trial points.
+
+  Returns:
+    The array of updated trial points.
+  """
+
+  # nested functions
+
+  def exchange(r: np.ndarray, lo: int, mi: int, hi: int) -> int:
+    """Identify new test point in an interval.
+
+    Identify point in interval [lo,hi) with same sign as the residual
+    error at mi (existing test point) and having an extreme magnitude. This is
+    the new test point to replace mi.
+
+    Args:
+      lo: The lowest point position in the interval.
+      mi: The position of current test point in the interval.
+      hi: The next higher point position after the interval.
+
+    Returns:
+      The position of the new test point in the interval
+    """
+    return lo + (np.argmin if r[mi] < 0.0 else np.argmax)(r[lo : hi])
+
+  # number of grid points
+  num = r_grid.size
+  # exchange first leftmost test point
+  trial_update[0] = exchange(r_grid, 0, trial[0], trial[1]) # type: ignore
+  # exchange intermediate test points
+  for i in range(1, trial.size-1): # type: ignore
+    trial_update[i] = exchange(r_grid, max(trial_update[i-1], trial[i-1])+1, # type: ignore
+      trial[i], trial[i+1]) # type: ignore
+  # exchange last rightmost test point
+  trial_update[-1] = exchange(r_grid, max(trial_update[-2], trial[-2])+1, # type: ignore
+    trial[-1], num) # type: ignore
+
+  # attempt to find an extrema residual to the left of the first test point
+  first_pos = min(trial_update[0], trial[0])
+  first_mag = 0.0
+  if first_pos > 0:
+    first_pos = extreme_point(r_grid[0 : first_pos])
+    if not is_same_sign(r_grid[first_pos], r_grid[trial_update[0]]):
+      mag = np.fabs(r_grid[first_pos])
+      if mag > np.fabs(r_grid[trial_update[-1]]):
+        first_mag = mag
+  # attempt to find an extrema residual to the right of the last test point
+  last_pos = max(trial_update[-1], trial[-1]) + 1
+  last_mag = 0.0
+  if last_pos < num:
+    last_pos += extreme_point(r_grid[last_pos : num])
+    if not is_same_sign(r_grid[last_pos], r_grid[trial_update[-1]]):
+      mag = np.fabs(r_grid[last_pos])
+      if first_mag == 0.0:
+        if mag > np.fabs(r_grid[trial_update[0]]):
+          last_mag = mag
+      elif mag > first_mag:
+        last_mag = mag
+  # if there is an additional extreme point insert it into the test points
+  if last_mag > 0.0:
+    # add new point to the right and delete the leftmost point
+    trial_update[:-1] = trial_update[1:]
+    trial_update[-1] = last_pos
+  elif first_mag > 0.0:
+    # add new point to the left and delete the rightmost point
+    trial_update[1:] = trial_update[:-1]
+    trial_update[0] = first_pos
+  return trial_update
+
+# exchange step for each variant of the algorithm
+EXCHANGES = {
+  'single': single_exchange,
+  'multi': multiple_exchange,
+}
+
+def remez_poly(
+  func,
+  start: float,
+  stop: float,
+  num: int,
+  ndeg: int,
+  max_iter: int,
+  exchange: str = 'multi',
+  dtype: type = np.float64
+) -> tuple[np.ndarray, float, int]:
+  """ Discrete Remez Algorithm for polynomials
+
+  It is used to find the optimal polynomial approximation to a function f on a
+  discrete linear grid.
+
+  Args:
+    func: A function (or lambda) f: x -> Result. If it accepts an array it is
+      applied to the whole grid in a single call.
+    start: The starting value of the grid.
+    stop: The end value of the grid.
+    num: The number of points on the grid.
+    ndeg: The degree of the approximation polynomial.
+    max_iter: The maximum number of iterations.
+    exchange: The exchange step used to update the trial points, either
+      'single' for the first algorithm or 'multi' for the second algorithm.
+      The default is the second algorithm, which needs fewer iterations.
+    dtype: The floating point type used to store the grid and the function
+      values. A smaller type such as np.float32 may be used when the error of
+      approximation is well above its precision. The linear system for the
+      trial polynomial is always solved in double precision.
+
+  Returns:
+    A tuple containing an array of the polynomial coefficients, a float
+    which is the maximum error of approximation and an integer which is the
+    number of iterations required. The ordering of the coefficients in the
+    array is: [a0, a1, ..., an], for an nth order polynomial.
+
+  Raises:
+    ValueError: The exchange or dtype argument is not recognised.
+  """
+  if not np.issubdtype(dtype, np.floating):
+    raise ValueError('Invalid dtype argument')
+  # create grid of points
+  grid = linear_grid(start, stop, num, dtype)
+  # function mapped onto grid
+  f_grid = map_onto_grid(func, grid).astype(dtype, copy=False)
+  return remez_grid(grid, f_grid, ndeg, max_iter, exchange)
+
+def remez_grid(
+  grid: np.ndarray,
+  f_grid: np.ndarray,
+  ndeg: int,
+  max_iter: int,
+  exchange: str = 'multi'
+) -> tuple[np.ndarray, float, int]:
+  """ Discrete Remez Algorithm for polynomials on a given grid
+
+  This is the numerical core of remez_poly. It operates only on the grid and
+  the function values mapped onto it, so no Python callbacks are made while
+  iterating.
+
+  Args:
+    grid: An array containing the grid points in ascending order. The
+      residual error over the grid is calculated in the floating point type
+      of this array, a grid of any other type is converted to np.float64.
+    f_grid: An array containing the function value at each grid point.
+    ndeg: The degree of the approximation polynomial.
+    max_iter: The maximum number of iterations.
+    exchange: The exchange step used to update the trial points, either
+      'single' for the first algorithm or 'multi' for the second algorithm.
+      The default is the second algorithm, which needs fewer iterations.
+
+  Returns:
+    The same tuple as remez_poly.
+
+  Raises:
+    ValueError: The exchange argument is not recognised.
+  """
+  if exchange not in EXCHANGES: raise ValueError('Invalid exchange argument')
+  update = EXCHANGES[exchange]
+  # floating point type of the grid, the function values and the residual
+  grid = np.asarray(grid)
+  if not np.issubdtype(grid.dtype, np.floating):
+    grid = grid.astype(np.float64)
+  f_grid = np.asarray(f_grid, dtype=grid.dtype)
+  # error scaling used to check for algorithm termination
+  scale = 1.0 + 4.55*np.spacing(1.0) # type: ignore
+  # initial level error
+  saved_level_error = 0.0
+  # number of grid points
+  num = grid.size
+  # powers of the grid points, [1, x, x**2, ..., x**ndeg], at each grid point
+  v_grid = np.vander(grid, ndeg+1, True).astype(grid.dtype, copy=False) # type: ignore
+  # alternate signs array
+  sigma = np.ones(ndeg+2)
+  sigma[1::2] = -1.0
+  # initial array of trial points
+  trial = chebpts(ndeg+2, num)
+  # linear system for the trial polynomial, the last column holds the signs
+  a = np.empty((ndeg+2, ndeg+2))
+  a[:, -1] = sigma
+  b = np.empty(ndeg+2)
+  # trial points currently held in the rows of the linear system
+  a_trial = np.full_like(trial, -1)
+  # residual error over the grid
+  r_grid = np.empty(num, dtype=grid.dtype)
+  # updated trial points
+  trial_update = np.empty_like(trial)
+
+  for it in range(max_iter):
+    # solve trial polynomial for given trial points, only the rows of the
+    # linear system for trial points that have changed are updated
+    changed = trial != a_trial
+    a_trial[changed] = trial[changed]
+    a[changed, :-1] = v_grid[a_trial[changed]]
+    b[changed] = f_grid[a_trial[changed]]
+    x = np.linalg.solve(a, b) # type: ignore
+    # retrieve polynomial coefficients
+    p = x[:-1]
+    # retrieve magnitude of the residual error at trial points
+    level_error = abs(x[-1])
+    # calculate the residual error over the grid
+    np.dot(v_grid, p.astype(v_grid.dtype, copy=False), out=r_grid)
+    np.subtract(f_grid, r_grid, out=r_grid)
+    # check this if iteration is close to the optimal polynomial
+    if level_error < scale*saved_level_error:
+      max_residual = abs(r_grid[extreme_point(r_grid)])
+      return (p, max_residual, it+1)
+    # save residual error for next iteration
+    saved_level_error = level_error
+    # update the trial points, the multiple exchange writes into the spare
+    # array which is then swapped with trial, whereas the single exchange
+    # updates trial in place and returns it, so both names then refer to the
+    # same array as no spare is needed
+    trial, trial_update = update(r_grid, trial, trial_update), trial
+  raise RuntimeWarning('Failed to converge!')
@@ -0,0 +1,66 @@
+"""Run all the polynomial approximation tests.
+
+Each test is independent, so the tests are run in parallel with one process
+per test. Plotting is disabled by setting the APPROX_NOPLOT environment
+variable, and matplotlib is given the non-interactive Agg backend through the
+MPLBACKEND environment variable so no process opens a window. These variables
+are only set in the worker processes, the calling process is unaffected. The
+output of each test is collected and displayed in the order the tests are
+listed.
+
+The durations printed by the tests are elapsed times from the performance
+counter, so they include contention with the other tests running at the same
+time. Run a test on its own for a representative duration.
+
+Module:
+  run_all
+
+Usage:
+  >>> from run_all import main
+  >>> main()
+  Polynomial approximation of ABS function
+  ...
+  Finished.
+"""
+
+import os
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from io import StringIO
+
+# modules containing the tests, each test is run by calling main()
+TESTS: list[str] = [
+  'abs_first_algorithm',
+  'abs_second_algorithm',
+  'abs_transform_sqrt',
+  'alaw_first_algorithm',
+  'alaw_second_algorithm',
+  'clipped_sine_first_algorithm',
+  'clipped_sine_second_algorithm',
+  'conversion_first_algorithm',
+  'conversion_second_algorithm',
+  'tan_first_algorithm',
+  'tan_second_algorithm',
+]
+
+def init_worker() -> None:
+  """Disable plotting in a worker process."""
+  os.environ['APPROX_NOPLOT'] = '1'
+  os.environ['MPLBACKEND'] = 'Agg'
+
+def run_test(name: str) -> str:
+  """Run a single test and return its output."""
+  output = StringIO()
+  with redirect_stdout(output):
+    import_module(name).main()
+  return output.getvalue()
+
+def main() -> None:
+  """Run all the tests in parallel without plotting."""
+  with ProcessPoolExecutor(initializer=init_worker) as executor:
+    for output in executor.map(run_test, TESTS):
+      print(output)
+
+if __name__ == '__main__':
+  main()
@@ -12,19 +12,19 @@ Usage:
   >>> main()
   Polynomial approximation of TAN function
   Order: 5
-  Coefficients: [-4.610770518016552e-05, 1.003821087881176e+00,
-  -5.068986304743081e-02, 5.725135256792672e-01, -4.770291791360212e-01,
-  4.919336458324009e-01]
+  Coefficients: [-4.610770518016959e-05, 1.003821087881177e+00,
+  -5.068986304743493e-02, 5.725135256792810e-01, -4.770291791360397e-01,
+  4.919336458324098e-01]
   Error: 4.610771e-05
   Iterations: 6
-  Duration: 0.0009 sec
+  Duration: 0.0033 sec
   Finished.
 """
 
-from time import process_time
-from math import tan, pi
+from time import perf_counter_ns
+from numpy import tan, pi
 from remes_first_algorithm import remez_poly
-from utility import plot_result
+from utility import plot_result, format_coeffs
 
 def main() -> None:
   """Polynomial approximation of TAN function"""
@@ -36,15 +36,16 @@ def main() -> None:
   mit = 10            # maximum number of iterations
   order = 5           # polynomial order
   # calculate the best approximation on grid
-  start_time = process_time()
+  start_time = perf_counter_ns()
   coefficients, error, it = remez_poly(f, lower, upper, num, order, mit)
-  end_time = process_time()
+  end_time = perf_counter_ns()
+  duration = 1.0e-9 * (end_time - start_time)
   # display the results
   print(f'Order: {order}')
-  print(f"Coefficients: [{', '.join([f'{c:.15e}' for c in coefficients])}]") # type: ignore
+  print(f'Coefficients: {format_coeffs(coefficients)}')
   print(f'Error: {error:.6e}')
   print(f'Iterations: {it}')
-  print(f'Duration: {end_time-start_time:.4f} sec')
+  print(f'Duration: {duration:.4f} sec')
   # plot the results
   plot_result(f, coefficients, lower, upper, num,
     'Polynomial Approximation of TAN function')
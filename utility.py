@@ -17,10 +17,44 @@ This modules contains the following helper functions:
   plot_polynomial: Plot the function and approximation polynomial. This
   function does not display the plot. The caller is expected to call matplotlib
   show and close.
+
+  show: Display the plots and block until the user has closed all figures.
+
+  plot_result: Plot the function, approximation polynomial and residual error
+  in a single window and display it.
+
+  compute_curves: Map the function and approximation polynomial onto the grid.
+  The result may be passed to both plot_residual and plot_polynomial so that
+  the curves are only evaluated once.
+
+  horner: Evaluate a polynomial on an array of points using Horner's method.
+
+  format_coeffs: Format an array of polynomial coefficients for display.
+
+The plotting functions do nothing if the APPROX_NOPLOT environment variable is
+set, for example when timing a batch of tests. Setting APPROX_DEBUG_EVERY to N
+restricts debug_residual to every Nth iteration. If APPROX_SAVEFIG is set to a
+file path, the non-interactive Agg backend is used and plot_result saves the
+figure to that file instead of displaying it.
 """
+import os
+import sys
+from typing import Optional
 import numpy as np
 from platform import system
+import matplotlib
+# select a non-interactive backend before pyplot is imported when saving plots
+if os.environ.get('APPROX_SAVEFIG'):
+  matplotlib.use('Agg')
 import matplotlib.pyplot as pp
+from remez_core import linear_grid, map_onto_grid
+
+# debug_residual only plots iterations that are a multiple of this, 0 plots all
+# and a malformed or negative value is ignored
+try:
+  _DEBUG_EVERY = max(int(os.environ.get('APPROX_DEBUG_EVERY', '0')), 0)
+except ValueError:
+  _DEBUG_EVERY = 0
 
 def debug_residual(
   iteration: int,
@@ -32,7 +66,8 @@ def debug_residual(
 
   This plot is intended for debugging purposes. It displays the residual error
   with the test points highlighted. This function will wait for the user to
-  close the plot window before exiting.
+  close the plot window before exiting. If the APPROX_DEBUG_EVERY environment
+  variable is set to N, only every Nth iteration is plotted.
 
   Args:
     iteration: The current iteration.
@@ -43,6 +78,10 @@ def debug_residual(
   Returns:
     None.
   """
+  if os.environ.get('APPROX_NOPLOT'):
+    return
+  if _DEBUG_EVERY and iteration % _DEBUG_EVERY:
+    return
   pp.figure(f'Iteration {iteration}')
   # plot the residual error with line graph
   pp.plot(grid, residual, color='blue')
@@ -55,6 +94,81 @@ def debug_residual(
   # display the plot
   pp.show(block=True)
 
+def horner(x: np.ndarray, coeffs: np.ndarray) -> np.ndarray:
+  """Evaluate a polynomial using Horner's method.
+
+  The result array is allocated once and updated in place for each
+  coefficient, so no intermediate arrays are created.
+
+  Args:
+    x: An array containing the points at which to evaluate the polynomial.
+    coeffs: Array of the polynomial coeffcients, [a0, a1, ..., an].
+
+  Returns:
+    An array containing the polynomial value at each point.
+  """
+  p = np.full_like(x, coeffs[-1], dtype=np.float64)
+  for c in coeffs[-2::-1]:
+    p *= x
+    p += c
+  return p
+
+def format_coeffs(coeffs: np.ndarray, prec: int = 15) -> str:
+  """Format the polynomial coefficients for display.
+
+  Args:
+    coeffs: Array of the polynomial coeffcients.
+    prec: Optional number of digits after the decimal point.
+
+  Returns:
+    A string containing the coefficients in scientific notation, separated by
+    commas and enclosed in square brackets, all on a single line.
+  """
+  return np.array2string(np.asarray(coeffs, dtype=np.float64), separator=', ',
+    formatter={'float_kind': lambda c: f'{c:.{prec}e}'},
+    max_line_width=sys.maxsize, threshold=sys.maxsize)
+
+def compute_curves(
+  func,
+  coeffs: np.ndarray,
+  start: float,
+  stop: float,
+  num: int,
+  even: bool = False,
+  mapped: Optional[tuple[np.ndarray, np.ndarray]] = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+  """Map the function and polynomial onto the grid.
+
+  Args:
+    func: A function (or lambda) f: X -> R. If it accepts an array it is
+      applied to the whole grid in a single call.
+    coeffs: Array (or sequence) of the polynomial coeffcients.
+    start: The starting value of the grid.
+    stop: The end value of the grid.
+    num: The number of points on the grid.
+    even: Optional flag indicating the polynomial is even and coeffs only
+      holds the even order coefficients, [a0, a2, ..., a2n].
+    mapped: Optional tuple of the grid and the function values already mapped
+      onto it for the same arguments, such as those passed to remez_grid. The
+      function is then not called again.
+
+  Returns:
+    A tuple containing the grid, the function mapped onto the grid and the
+    polynomial mapped onto the grid.
+  """
+  # contiguous double precision coefficients, which may be given as a list
+  coeffs = np.ascontiguousarray(coeffs, dtype=np.float64)
+  if mapped is None:
+    # construct the grid
+    grid = linear_grid(start, stop, num)
+    # function mapped onto grid
+    f_grid = map_onto_grid(func, grid)
+  else:
+    grid, f_grid = mapped
+  # polynomial mapped over grid, an even polynomial is evaluated in x**2
+  p_grid = horner(grid*grid if even else grid, coeffs)
+  return (grid, f_grid, p_grid)
+
 def plot_residual(
   func,
   coeffs: np.ndarray,
@@ -62,6 +176,7 @@ def plot_residual(
   stop: float,
   num: int,
   title: str = str(),
+  curves: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
 ) -> None:
   """Plot the residual error on the grid for a given polynomial and function.
 
@@ -70,21 +185,23 @@ def plot_residual(
   calling matplotlib.show and matplotlib.close.
 
   Args:
-    func: A function (or lambda) f: X -> R.
+    func: A function (or lambda) f: X -> R. If it accepts an array it is
+      applied to the whole grid in a single call.
     coeffs: Array of the polynomial coeffcients.
     start: The starting value of the grid.
     stop: The end value of the grid.
     num: The number of points on the grid.
     title: Optional title string to appear in plot area.
+    curves: Optional result of compute_curves for the same arguments.
 
   Returns:
     None.
   """
-  # construct the grid
-  s = np.linspace(start, stop, num)
-  # function mapped onto grid
-  f = np.vectorize(func)(s)
-  residual = f - np.polynomial.polynomial.polyval(s, coeffs)
+  if os.environ.get('APPROX_NOPLOT'):
+    return
+  # function and polynomial mapped onto grid
+  s, f, p = curves or compute_curves(func, coeffs, start, stop, num)
+  residual = f - p
   # plot the residual error
   pp.figure('Residual error')
   pp.plot(s, residual, color='blue')
@@ -101,6 +218,7 @@ def plot_polynomial(
   stop: float,
   num: int,
   title: str = str(),
+  curves: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
 ) -> None:
   """Plot the polynomial and function on the grid
 
@@ -109,22 +227,22 @@ def plot_polynomial(
   calling matplotlib.show and matplotlib.close.
 
   Args:
-    func: A function (or lambda) f: X -> R.
+    func: A function (or lambda) f: X -> R. If it accepts an array it is
+      applied to the whole grid in a single call.
     coeffs: Array of the polynomial coeffcients.
     start: The starting value of the grid.
     stop: The end value of the grid.
     num: The number of points on the grid.
     title: Optional title string to appear in plot area.
+    curves: Optional result of compute_curves for the same arguments.
 
   Returns:
     None.
   """
-  # construct the absissa grid
-  x = np.linspace(start, stop, num)
-  # function mapped onto grid
-  f = np.vectorize(func)(x)
-  # polynomial mapped over grid
-  p = np.polynomial.polynomial.polyval(x, coeffs)
+  if os.environ.get('APPROX_NOPLOT'):
+    return
+  # function and polynomial mapped onto grid
+  x, f, p = curves or compute_curves(func, coeffs, start, stop, num)
   # plot the function and polynomial
   pp.figure('Polynomial Approximation')
   pp.plot(x, f, 'r-', label='Function')
@@ -138,6 +256,8 @@ def plot_polynomial(
 
 def show() -> None:
   """ Display plots and block until the user has closed all figures."""
+  if os.environ.get('APPROX_NOPLOT'):
+    return
   pp.show(block=True)
 
 def plot_result(
@@ -147,31 +267,40 @@ def plot_result(
   stop: float,
   num: int,
   title: str = str(),
+  even: bool = False,
+  mapped: Optional[tuple[np.ndarray, np.ndarray]] = None,
 ) -> None:
   """Plot and display the polynomial approximation results
 
   This function generates a window containing two vertically stacked graphs.
   The top graph contains plots of the polynomial approximation and the
   function. The bottom graph is a plot of the residual error. This function will
-  block until the user closes the window.
+  block until the user closes the window. Nothing is plotted if the APPROX_NOPLOT
+  environment variable is set, for example when timing a batch of tests. If the
+  APPROX_SAVEFIG environment variable is set the figure is saved to the file it
+  names rather than displayed.
 
   Arg:
-    func: A function (or lambda) f: X -> Result.
+    func: A function (or lambda) f: X -> Result. If it accepts an array it
+      is applied to the whole grid in a single call.
     coeffs: Array of the polynomial coeffcients.
     start: The starting value of the grid.
     stop: The end value of the grid.
     num: The number of points on the grid.
     title: Optional title string to appear on the window titlebar.
+    even: Optional flag indicating the polynomial is even and coeffs only
+      holds the even order coefficients, [a0, a2, ..., a2n].
+    mapped: Optional tuple of the grid and the function values already mapped
+      onto it, see compute_curves.
 
   Returns:
     none
   """
-  # construct the grid
-  grid = np.linspace(start, stop, num)
-  # function mapped onto grid
-  f_grid = np.vectorize(func)(grid)
-  # polynomial mapped over grid
-  p_grid = np.polynomial.polynomial.polyval(grid, coeffs)
+  if os.environ.get('APPROX_NOPLOT'):
+    return
+  # function and polynomial mapped onto grid
+  grid, f_grid, p_grid = compute_curves(func, coeffs, start, stop, num, even,
+    mapped)
   # residual error mapped over grid
   r_grid = f_grid - p_grid
   # create a window with two plots, (polynomial and residual error)
@@ -195,6 +324,10 @@ def plot_result(
     pp.get_current_fig_manager().set_window_title(title)
   # window maximized
   # plot_maximize()
-  # display plots
-  pp.show()
+  # save or display plots
+  save_path = os.environ.get('APPROX_SAVEFIG')
+  if save_path:
+    pp.savefig(save_path)
+  else:
+    pp.show()
   pp.close()